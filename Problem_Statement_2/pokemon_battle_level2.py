@@ -2,50 +2,61 @@ import random
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
 
+from pokemon_core import Pokemon as CorePokemon
+
 random.seed(12345)  # deterministic for demo runs
 
-@dataclass
-class Pokemon:
-    name: str
-    max_hp: int
-    attack: int
-    defense: int
-    speed: int
-    moves: List[Tuple[str, int]]  # list of (move_name, power)
-    hp: int = field(init=False)
+@dataclass(slots=True, eq=False)
+class Pokemon(CorePokemon):
+    # moves: list of (move_name, power)
+    _auto_idx: Optional[int] = field(init=False, repr=False, default=None)
     
     def __post_init__(self):
-        self.hp = self.max_hp
-    
-    def is_fainted(self):
-        return self.hp <= 0
+        CorePokemon.__post_init__(self)
+        # moves never change, so the "auto" pick (strongest move, earliest on ties) is fixed
+        damaging = [i for i, (_, p) in enumerate(self.moves) if p > 0]
+        self._auto_idx = max(damaging, key=lambda i: (self.moves[i][1], -i)) if damaging else None
     
-    def choose_move(self, choice):
+    def choose_move(self, choice, rng=random):
         if choice == "auto" or choice is None:
-            non_zero = [(i,p) for i,(_,p) in enumerate(self.moves) if p>0]
-            if non_zero:
-                best = max(non_zero, key=lambda x: (x[1], -x[0]))
-                return best[0]
-            return random.randrange(len(self.moves))
+            if self._auto_idx is not None:
+                return self._auto_idx
+            return rng.randrange(len(self.moves))
         if not isinstance(choice, int):
             raise ValueError("move choice must be int index or 'auto'")
         return max(0, min(choice, len(self.moves)-1))
 
 
 class Battle:
-    def __init__(self, p1: Pokemon, p2: Pokemon, crit_chance: float = 0.10):
+    __slots__ = ('p1', 'p2', 'crit_chance', 'rng', '_rand', 'verbose', 'turn_count', 'crit_hits', '_order')
+
+    def __init__(self, p1: Pokemon, p2: Pokemon, crit_chance: float = 0.10, rng: Optional[random.Random] = None,
+                 verbose: bool = True):
         self.p1 = p1
         self.p2 = p2
         self.crit_chance = crit_chance
+        # module generator by default so random.seed() above keeps demo runs deterministic
+        self.rng = rng if rng is not None else random
+        self._rand = self.rng.random
+        # verbose=False runs the battle silently (no message strings are built)
+        self.verbose = verbose
         self.turn_count = 0
         self.crit_hits = 0
+        # Speeds don't change mid-battle, so the turn order is settled once (None on a tie)
+        if p1.speed > p2.speed:
+            self._order = (p1, p2)
+        elif p2.speed > p1.speed:
+            self._order = (p2, p1)
+        else:
+            self._order = None
     
     def _log(self, msg=""):
-        print(msg)
+        if self.verbose:
+            print(msg)
     
     def _damage(self, attacker: Pokemon, defender: Pokemon, move_power: int) -> int:
-        base = int((attacker.attack * move_power) / defender.defense)
-        is_crit = random.random() < self.crit_chance
+        base = (attacker.attack * move_power) // defender.defense
+        is_crit = self._rand() < self.crit_chance
         damage = base * (2 if is_crit else 1)
         damage = max(1, damage)
         return damage, is_crit
@@ -55,22 +66,23 @@ class Battle:
         self._log(f"{self.p1.name} (HP: {self.p1.hp}/{self.p1.max_hp}) VS {self.p2.name} (HP: {self.p2.hp}/{self.p2.max_hp})\n")
         
         choice_index = 0
-        while not self.p1.is_fainted() and not self.p2.is_fainted():
+        while self.p1.alive and self.p2.alive:
             self.turn_count += 1
-            if self.p1.speed > self.p2.speed:
-                first, second = self.p1, self.p2
-                tie_note = ""
-            elif self.p2.speed > self.p1.speed:
-                first, second = self.p2, self.p1
+            if self._order is not None:
+                first, second = self._order
                 tie_note = ""
+            elif self._rand() < 0.5:
+                first, second = self.p1, self.p2
+                tie_note = "Speed tie! "
             else:
-                first, second = random.choice([(self.p1, self.p2), (self.p2, self.p1)])
+                first, second = self.p2, self.p1
                 tie_note = "Speed tie! "
             
-            if first is self.p1:
-                self._log(f"Turn {self.turn_count}: {tie_note}{self.p1.name} goes first! (Speed: {self.p1.speed} vs {self.p2.speed})")
-            else:
-                self._log(f"Turn {self.turn_count}: {tie_note}{self.p2.name} goes first! (Speed: {self.p2.speed} vs {self.p1.speed})")
+            if self.verbose:
+                if first is self.p1:
+                    self._log(f"Turn {self.turn_count}: {tie_note}{self.p1.name} goes first! (Speed: {self.p1.speed} vs {self.p2.speed})")
+                else:
+                    self._log(f"Turn {self.turn_count}: {tie_note}{self.p2.name} goes first! (Speed: {self.p2.speed} vs {self.p1.speed})")
             
             p1_choice = p2_choice = "auto"
             if manual_choices and choice_index < len(manual_choices):
@@ -81,11 +93,12 @@ class Battle:
             
             for attacker, defender, choice in [(first, second, p1_choice if first is self.p1 else p2_choice),
                                                (second, first, p2_choice if second is self.p2 else p1_choice)]:
-                if attacker.is_fainted() or defender.is_fainted():
+                if not attacker.alive or not defender.alive:
                     continue
-                move_idx = attacker.choose_move(choice)
+                move_idx = attacker.choose_move(choice, self.rng)
                 move_name, power = attacker.moves[move_idx]
-                self._log(f"{attacker.name} used {move_name}!")
+                if self.verbose:
+                    self._log(f"{attacker.name} used {move_name}!")
                 if power <= 0:
                     self._log("It had no effect!")
                     continue
@@ -94,11 +107,13 @@ class Battle:
                     self._log("Critical Hit!")
                     self.crit_hits += 1
                 defender.hp -= dmg
-                if defender.hp < 0:
+                if defender.hp <= 0:
                     defender.hp = 0
-                self._log(f"{defender.name} took {dmg} damage!")
-                self._log(f"{defender.name} HP: {defender.hp}/{defender.max_hp}\n")
-                if defender.is_fainted():
+                    defender.alive = False
+                if self.verbose:
+                    self._log(f"{defender.name} took {dmg} damage!")
+                    self._log(f"{defender.name} HP: {defender.hp}/{defender.max_hp}\n")
+                if not defender.alive:
                     self._log(f"{defender.name} fainted!")
                     self._log(f"🏆 {attacker.name} wins the battle!\n")
                     self._log("Battle Summary:")
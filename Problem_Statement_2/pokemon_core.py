@@ -0,0 +1,27 @@
+"""
+Shared Pokemon record for the Level 2 and Level 3 battle scripts.
+
+Both levels subclass this class so every battle works on one attribute
+scheme (hp/attack/defense/speed) and one concrete base type.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+
+@dataclass(slots=True, eq=False)
+class Pokemon:
+    name: str
+    max_hp: int
+    attack: int
+    defense: int
+    speed: int
+    moves: List[Tuple]  # (name, power) or (name, power, effect)
+    hp: int = field(init=False)
+    alive: bool = field(init=False, default=True)  # cleared when HP reaches 0
+
+    def __post_init__(self):
+        self.hp = self.max_hp
+
+    def is_fainted(self):
+        return self.hp <= 0
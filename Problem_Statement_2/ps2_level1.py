@@ -1,4 +1,6 @@
 class Pokemon:
+    __slots__ = ('name', 'max_hp', 'current_hp', 'attack_stat', 'defense_stat', 'speed_stat', 'moves')
+
     def __init__(self, name, hp, attack, defense, speed, moves):
         self.name = name
         self.max_hp = hp
@@ -12,12 +12,13 @@ Usage examples are included at the bottom of this file.
 
 import random
 import math
-from copy import deepcopy
 from typing import List, Tuple, Optional, Dict
 
+from pokemon_core import Pokemon as CorePokemon
+
 # -------------------- Helpers & Constants --------------------
 CRITICAL_CHANCE = 0.10
-CRITICAL_MULT = 2.0
+CRITICAL_MULT = 2
 
 STATUS_POISON = "poison"
 STATUS_PARALYSIS = "paralysis"
@@ -29,38 +30,75 @@ POISON_DURATION = 4
 PARALYSIS_DURATION = 3
 SLEEP_MIN = 2
 SLEEP_MAX = 4
+SLEEP_SPAN = SLEEP_MAX - SLEEP_MIN + 1  # sleep turns drawn as SLEEP_MIN + int(u * SLEEP_SPAN)
+
+# Statuses are stored as a bit mask plus one duration slot per status
+POISON_SLOT, PARALYSIS_SLOT, SLEEP_SLOT = 0, 1, 2
+POISON_BIT = 1 << POISON_SLOT
+PARALYSIS_BIT = 1 << PARALYSIS_SLOT
+SLEEP_BIT = 1 << SLEEP_SLOT
+STATUS_NAMES = (STATUS_POISON, STATUS_PARALYSIS, STATUS_SLEEP)  # indexed by slot
+STATUS_SLOTS = {STATUS_POISON: POISON_SLOT, STATUS_PARALYSIS: PARALYSIS_SLOT, STATUS_SLEEP: SLEEP_SLOT}
+STATUS_BITS = {STATUS_POISON: POISON_BIT, STATUS_PARALYSIS: PARALYSIS_BIT, STATUS_SLEEP: SLEEP_BIT}
+
+# Most frequent battle message (every damaging hit), kept as one %-template
+_HP_TMPL = "%s took %d damage!\n%s HP: %d/%d"
 
 # -------------------- Pokemon --------------------
-class Pokemon:
-    def __init__(self, name: str, max_hp: int, attack: int, defense: int, speed: int, moves: List[Tuple]):
-        """moves: list of tuples. Each tuple can be one of:
-           (name, power) or (name, power, effect) where effect in {"poison","paralysis","sleep"}
-           power==0 means a purely status/utility move
-        """
-        self.name = name
-        self.max_hp = max_hp
-        self.hp = max_hp
-        self.attack = attack
-        self.defense = defense
-        self.speed = speed
-        self.moves = moves
-        self.statuses: Dict[str, Dict] = {}  # effect -> {duration: int}
-        self.alive = True
-
-    def is_fainted(self):
-        return self.hp <= 0
-
-    def apply_status(self, effect: str, duration: Optional[int] = None):
-        if effect == STATUS_POISON:
-            self.statuses[STATUS_POISON] = {'duration': duration if duration is not None else POISON_DURATION}
-        elif effect == STATUS_PARALYSIS:
-            self.statuses[STATUS_PARALYSIS] = {'duration': duration if duration is not None else PARALYSIS_DURATION}
-        elif effect == STATUS_SLEEP:
-            self.statuses[STATUS_SLEEP] = {'duration': duration if duration is not None else random.randint(SLEEP_MIN, SLEEP_MAX)}
+class Pokemon(CorePokemon):
+    """Pokemon(name, max_hp, attack, defense, speed, moves)
+
+    moves: list of tuples. Each tuple can be one of:
+       (name, power) or (name, power, effect) where effect in {"poison","paralysis","sleep"}
+       power==0 means a purely status/utility move
+    """
+    __slots__ = ('move_power', 'move_effect', 'damaging_idx', 'status_idx',
+                 'damaging_desc', 'status_moves', 'status_mask', 'status_dur')
+
+    def __post_init__(self):
+        CorePokemon.__post_init__(self)
+        moves = self.moves
+        # Column view of the moves (one tuple per field) so move pickers filter by index
+        self.move_power = tuple(m[1] if len(m) > 1 else 0 for m in moves)
+        self.move_effect = tuple(STATUS_BITS.get(m[2], 0) if len(m) > 2 else 0 for m in moves)
+        self.damaging_idx = tuple(i for i, p in enumerate(self.move_power) if p > 0)
+        self.status_idx = tuple(i for i, e in enumerate(self.move_effect) if e)
+        # Move lists the AI picks from, strongest damaging move first
+        self.damaging_desc = sorted([moves[i] for i in self.damaging_idx], key=lambda m: -m[1])
+        self.status_moves = [moves[i] for i in self.status_idx]
+        self.status_mask = 0  # STATUS_BITS of the active statuses
+        self.status_dur = [0, 0, 0]  # turns left, indexed by status slot
+
+    @property
+    def statuses(self) -> Dict[str, Dict]:
+        # Read-only view in the old {effect: {'duration': turns}} shape
+        return {STATUS_NAMES[slot]: {'duration': self.status_dur[slot]}
+                for slot in range(3) if self.status_mask & (1 << slot)}
+
+    def has_status(self, effect: str) -> bool:
+        return bool(self.status_mask & STATUS_BITS.get(effect, 0))
+
+    def status_turns(self, effect: str) -> int:
+        return self.status_dur[STATUS_SLOTS[effect]] if self.has_status(effect) else 0
+
+    def apply_status(self, effect: str, duration: Optional[int] = None, rand=random.random):
+        # rand draws the sleep length; battles pass their own generator's random
+        if effect not in STATUS_BITS:
+            return
+        if duration is None:
+            if effect == STATUS_POISON:
+                duration = POISON_DURATION
+            elif effect == STATUS_PARALYSIS:
+                duration = PARALYSIS_DURATION
+            else:
+                duration = SLEEP_MIN + int(rand() * SLEEP_SPAN)
+        self.status_mask |= STATUS_BITS[effect]
+        self.status_dur[STATUS_SLOTS[effect]] = duration
 
     def clear_status(self, effect: str):
-        if effect in self.statuses:
-            del self.statuses[effect]
+        if effect in STATUS_BITS:
+            self.status_mask &= ~STATUS_BITS[effect]
+            self.status_dur[STATUS_SLOTS[effect]] = 0
 
     def take_damage(self, dmg: int):
         self.hp -= dmg
@@ -68,66 +106,148 @@ class Pokemon:
             self.hp = 0
             self.alive = False
 
-    def end_of_turn(self):
-        # Handle poison damage
+    def end_of_turn(self, log: bool = True):
+        # log=False applies the effects without formatting any event messages
         events = []
-        if STATUS_POISON in self.statuses:
-            pct = POISON_PERCENT
-            dmg = math.ceil(self.max_hp * pct)
+        mask = self.status_mask
+        if not mask:
+            return events
+        # Handle poison damage
+        if mask & POISON_BIT:
+            dmg = math.ceil(self.max_hp * POISON_PERCENT)
             self.take_damage(dmg)
-            events.append(f"{self.name} takes {dmg} poison damage!\n{self.name} HP: {self.hp}/{self.max_hp}")
-            self.statuses[STATUS_POISON]['duration'] -= 1
-            if self.statuses[STATUS_POISON]['duration'] <= 0:
-                self.clear_status(STATUS_POISON)
-                events.append(f"{self.name} is no longer poisoned!")
-        # Decrease other durations without immediate effect
-        for st in [STATUS_PARALYSIS, STATUS_SLEEP]:
-            if st in self.statuses:
-                self.statuses[st]['duration'] -= 1
-                if self.statuses[st]['duration'] <= 0:
-                    self.clear_status(st)
-                    events.append(f"{self.name} is no longer {st}ed!")
+            if log:
+                events.append(f"{self.name} takes {dmg} poison damage!\n{self.name} HP: {self.hp}/{self.max_hp}")
+        # Tick every active status down, poison first
+        dur = self.status_dur
+        for slot in range(3):
+            bit = 1 << slot
+            if mask & bit:
+                dur[slot] -= 1
+                if dur[slot] <= 0:
+                    dur[slot] = 0
+                    mask &= ~bit
+                    if not log:
+                        continue
+                    if slot == POISON_SLOT:
+                        events.append(f"{self.name} is no longer poisoned!")
+                    else:
+                        events.append(f"{self.name} is no longer {STATUS_NAMES[slot]}ed!")
+        self.status_mask = mask
         return events
 
     def status_summary(self):
         parts = []
-        for k, v in self.statuses.items():
-            parts.append(f"{k} ({v['duration']} turns)")
+        for slot in range(3):
+            if self.status_mask & (1 << slot):
+                parts.append(f"{STATUS_NAMES[slot]} ({self.status_dur[slot]} turns)")
         return ", ".join(parts) if parts else "None"
 
     def copy_for_battle(self):
-        return deepcopy(self)
+        # Field-by-field clone instead of deepcopy: the move list is never mutated
+        # and can be shared, only the status durations need their own copy
+        cls = type(self)  # keep subclasses' type, as deepcopy did
+        p = cls.__new__(cls)
+        p.name = self.name
+        p.max_hp = self.max_hp
+        p.hp = self.hp
+        p.attack = self.attack
+        p.defense = self.defense
+        p.speed = self.speed
+        p.moves = self.moves
+        p.move_power = self.move_power
+        p.move_effect = self.move_effect
+        p.damaging_idx = self.damaging_idx
+        p.status_idx = self.status_idx
+        p.damaging_desc = self.damaging_desc
+        p.status_moves = self.status_moves
+        p.status_mask = self.status_mask
+        p.status_dur = self.status_dur[:]
+        p.alive = self.alive
+        return p
 
 # -------------------- Damage calculation --------------------
 
-def calculate_damage(attacker: Pokemon, defender: Pokemon, move_power: int):
-    # Base damage formula
+def _damage_kernel(atk: int, power: int, defn: int, crit_roll: float):
+    # Plain-number damage formula shared by calculate_damage and simulate_bracket
+    # Integer floor division, so floor(atk * power * mult / defn) is exact
+    was_crit = crit_roll < CRITICAL_CHANCE
+    raw = atk * power * CRITICAL_MULT if was_crit else atk * power
+    return max(1, raw // max(1, defn)), was_crit
+
+
+def calculate_damage(attacker: Pokemon, defender: Pokemon, move_power: int, crit_roll: Optional[float] = None):
+    # Base damage formula; crit_roll is a uniform [0, 1) draw, rolled here if not given
     if move_power <= 0:
         return 0
-    base = (attacker.attack * move_power) / max(1, defender.defense)
-    # Critical
-    crit = 1
-    if random.random() < CRITICAL_CHANCE:
-        crit = CRITICAL_MULT
-    dmg = math.floor(base * crit)
-    return max(1, dmg), crit > 1
+    if crit_roll is None:
+        crit_roll = random.random()
+    return _damage_kernel(attacker.attack, move_power, defender.defense, crit_roll)
+
+def _rank_picks(atk: int, move_power: Tuple[int, ...], move_effect: Tuple[int, ...], defn: int):
+    # auto_choose_move's pick (a move index) for every state of the opponent, at
+    # index 2 * opponent status mask + (0 above 70% HP, 1 at or below).
+    # Score = expected damage without crit (crits happen at damage time, not
+    # when planning) plus a bonus for status moves, larger while the foe is healthy.
+    # A status-only move is skipped when the foe already has that status, so two
+    # status users can't trade no-damage moves forever.
+    base = [_damage_kernel(atk, power, defn, 1.0)[0] if power > 0 else 0 for power in move_power]
+    picks = []
+    for mask in range(8):
+        for status_bonus in (15, 10):
+            best, best_score = 0, -1
+            for i, effect in enumerate(move_effect):
+                if effect & mask and not move_power[i]:
+                    continue
+                score = base[i] + status_bonus if effect else base[i]
+                if score > best_score:
+                    best, best_score = i, score
+            picks.append(best)
+    return tuple(picks)
 
 # -------------------- Battle --------------------
 class Battle:
-    def __init__(self, p1: Pokemon, p2: Pokemon, verbose: bool = True):
-        self.p1 = p1.copy_for_battle()
-        self.p2 = p2.copy_for_battle()
-        self.turn = 0
+    __slots__ = ('p1', 'p2', 'turn', 'verbose', 'collect_log', 'log_enabled', 'rng', '_rand',
+                 'log', 'stats', '_auto_picks')
+
+    def __init__(self, p1: Pokemon, p2: Pokemon, verbose: bool = True, rng: Optional[random.Random] = None,
+                 collect_log: bool = False, copy: bool = True):
         self.verbose = verbose
+        # Messages are kept in self.log only when asked for; with neither printing nor
+        # collecting, the per-turn message strings are never built at all
+        self.collect_log = collect_log
+        self.log_enabled = verbose or collect_log
+        # Random source for crits, paralysis and AI picks (module generator by default).
+        # The bound .random is kept so per-hit rolls skip the module/attribute lookups.
+        self.rng = rng if rng is not None else random
+        self._rand = self.rng.random
         self.log: List[str] = []
+        # copy=False fights p1/p2 themselves, as reset() does
+        if copy:
+            p1, p2 = p1.copy_for_battle(), p2.copy_for_battle()
+        self.reset(p1, p2)
+
+    def reset(self, p1: Pokemon, p2: Pokemon):
+        # Re-arm this Battle for a new pair. Unlike the constructor, p1/p2 are used
+        # as given (not copied), so HP and statuses change on the objects passed in.
+        self.p1 = p1
+        self.p2 = p2
+        self.turn = 0
+        self.log.clear()
         self.stats = {
             'turns': 0,
             'status_used': 0,
             'critical_hits': 0,
         }
+        # auto_choose_move scores only depend on the matchup, so rank the moves once
+        self._auto_picks = {
+            p1: self._rank_moves(p1, p2),
+            p2: self._rank_moves(p2, p1),
+        }
 
     def logf(self, s: str):
-        self.log.append(s)
+        if self.collect_log:
+            self.log.append(s)
         if self.verbose:
             print(s)
 
@@ -138,80 +258,73 @@ class Battle:
 
         if power <= 0 and effect is None:
             # purely non-effect, do nothing
-            self.logf(f"{user.name} used {name}. (No effect)")
+            if self.log_enabled:
+                self.logf(f"{user.name} used {name}. (No effect)")
             return
 
         # Status-only move
         if power <= 0 and effect:
             # Apply status
-            if effect not in target.statuses:
-                target.apply_status(effect)
+            if not target.has_status(effect):
+                target.apply_status(effect, rand=self._rand)
                 self.stats['status_used'] += 1
-                self.logf(f"{user.name} used {name}!")
-                self.logf(f"{target.name} is now {effect}! ({target.statuses[effect]['duration']} turns remaining)")
-            else:
+                if self.log_enabled:
+                    self.logf(f"{user.name} used {name}!")
+                    self.logf(f"{target.name} is now {effect}! ({target.status_turns(effect)} turns remaining)")
+            elif self.log_enabled:
                 self.logf(f"{user.name} used {name}, but {target.name} already has {effect}.")
             return
 
         # Damage move
-        dmg, was_crit = calculate_damage(user, target, power)
+        dmg, was_crit = calculate_damage(user, target, power, self._rand())
         target.take_damage(dmg)
-        self.logf(f"{user.name} used {name}!")
         if was_crit:
             self.stats['critical_hits'] += 1
-            self.logf("Critical Hit!")
-        self.logf(f"{target.name} took {dmg} damage!\n{target.name} HP: {target.hp}/{target.max_hp}")
+        if self.log_enabled:
+            self.logf(f"{user.name} used {name}!")
+            if was_crit:
+                self.logf("Critical Hit!")
+            self.logf(_HP_TMPL % (target.name, dmg, target.name, target.hp, target.max_hp))
 
         # Some damage moves may also carry a status effect (optional)
-        if effect and effect not in target.statuses and target.alive:
-            target.apply_status(effect)
+        if effect and not target.has_status(effect) and target.alive:
+            target.apply_status(effect, rand=self._rand)
             self.stats['status_used'] += 1
-            self.logf(f"{target.name} is now {effect}! ({target.statuses[effect]['duration']} turns remaining)")
+            if self.log_enabled:
+                self.logf(f"{target.name} is now {effect}! ({target.status_turns(effect)} turns remaining)")
 
     def can_act(self, pokemon: Pokemon):
         # Check sleep
-        if STATUS_SLEEP in pokemon.statuses:
-            self.logf(f"{pokemon.name} is asleep and cannot move! (Sleep turns left: {pokemon.statuses[STATUS_SLEEP]['duration']})")
+        if pokemon.has_status(STATUS_SLEEP):
+            if self.log_enabled:
+                self.logf(f"{pokemon.name} is asleep and cannot move! (Sleep turns left: {pokemon.status_turns(STATUS_SLEEP)})")
             return False
         # Check paralysis
-        if STATUS_PARALYSIS in pokemon.statuses:
-            if random.random() < 0.5:
-                self.logf(f"{pokemon.name} is paralyzed and cannot move! (Paralysis turns left: {pokemon.statuses[STATUS_PARALYSIS]['duration']})")
+        if pokemon.has_status(STATUS_PARALYSIS):
+            if self._rand() < 0.5:
+                if self.log_enabled:
+                    self.logf(f"{pokemon.name} is paralyzed and cannot move! (Paralysis turns left: {pokemon.status_turns(STATUS_PARALYSIS)})")
                 return False
         return True
 
     def run_turn(self, mover: Pokemon, other: Pokemon, mover_choice: Tuple):
-        if mover.is_fainted() or other.is_fainted():
+        if not mover.alive or not other.alive:
             return
         if not self.can_act(mover):
             return
         self.apply_move(mover, other, mover_choice)
 
+    def _rank_moves(self, user: Pokemon, opponent: Pokemon):
+        return _rank_picks(user.attack, user.move_power, user.move_effect, opponent.defense)
+
     def auto_choose_move(self, user: Pokemon, opponent: Pokemon):
         # Default naive choice: pick move with highest expected damage; consider status moves
         # Return move tuple
-        # For non-AI battles, this can be used as a fallback random choice
-        best = None
-        best_score = -1
-        for mv in user.moves:
-            name = mv[0]
-            power = mv[1] if len(mv) > 1 else 0
-            effect = mv[2] if len(mv) > 2 else None
-            score = 0
-            if power > 0:
-                est_dmg, _ = calculate_damage(user, opponent, power)
-                score += est_dmg
-            if effect:
-                # Score status moves by how much they could change the fight
-                score += 10
-                if opponent.hp / opponent.max_hp > 0.7:
-                    score += 5
-            # Slight randomness
-            score *= random.uniform(0.9, 1.1)
-            if score > best_score:
-                best_score = score
-                best = mv
-        return best if best else random.choice(user.moves)
+        picks = self._auto_picks.get(user)
+        if picks is None:
+            picks = self._rank_moves(user, opponent)
+        row = 2 * opponent.status_mask
+        return user.moves[picks[row] if opponent.hp * 10 > opponent.max_hp * 7 else picks[row + 1]]
 
     def start_battle(self, ai_controller: Optional[Dict] = None):
         # ai_controller: {'which': 'p1' or 'p2', 'difficulty': 'easy'/'medium'/'hard'}
@@ -224,32 +337,28 @@ class Battle:
             else:
                 self.logf(f"{self.p2.name} is controlled by COMPUTER")
 
+        # Determine order (speeds are fixed for the whole battle)
+        first, second = (self.p1, self.p2) if self.p1.speed >= self.p2.speed else (self.p2, self.p1)
+        # Resolve the AI side and its strategy once rather than every turn
+        ai_move = None
+        if ai_controller and ai_controller.get('which'):
+            ai_move = self._ai_strategy(ai_controller.get('difficulty', 'medium'))
+            ai_user, ai_foe = (self.p1, self.p2) if ai_controller['which'] == 'p1' else (self.p2, self.p1)
         while self.p1.alive and self.p2.alive:
             self.turn += 1
             self.stats['turns'] = self.turn
-            # Determine order
-            first, second = (self.p1, self.p2) if self.p1.speed >= self.p2.speed else (self.p2, self.p1)
-            self.logf(f"\nTurn {self.turn}: {first.name} goes first! (Speed: {first.speed} vs {second.speed})")
+            if self.log_enabled:
+                self.logf(f"\nTurn {self.turn}: {first.name} goes first! (Speed: {first.speed} vs {second.speed})")
 
             # Decide moves
             # If AI is controlling one side, use its choice strategy
             choice_first = None
             choice_second = None
-            # simple default choices
-            if ai_controller and ai_controller.get('which'):
-                which = ai_controller['which']
-                difficulty = ai_controller.get('difficulty', 'medium')
-                # map Pokemon instances to p1/p2
-                if which == 'p1':
-                    if first is self.p1:
-                        choice_first = self.ai_choose_move(self.p1, self.p2, difficulty)
-                    else:
-                        choice_second = self.ai_choose_move(self.p1, self.p2, difficulty)
+            if ai_move is not None:
+                if first is ai_user:
+                    choice_first = ai_move(ai_user, ai_foe)
                 else:
-                    if first is self.p2:
-                        choice_first = self.ai_choose_move(self.p2, self.p1, difficulty)
-                    else:
-                        choice_second = self.ai_choose_move(self.p2, self.p1, difficulty)
+                    choice_second = ai_move(ai_user, ai_foe)
 
             # Fill remaining choices with auto_choose_move
             if choice_first is None:
@@ -263,23 +372,15 @@ class Battle:
                 self.run_turn(second, first, choice_second)
 
             # End-of-turn effects
-            e1 = self.p1.end_of_turn()
-            e2 = self.p2.end_of_turn()
-            for ev in e1 + e2:
-                self.logf(ev)
-
-            # Check faint
-            if self.p1.is_fainted():
-                self.logf(f"{self.p1.name} fainted!")
-                winner = self.p2
-                break
-            if self.p2.is_fainted():
-                self.logf(f"{self.p2.name} fainted!")
-                winner = self.p1
-                break
-
-        # Determine winner
-        winner = self.p1 if self.p1.alive else self.p2
+            e1 = self.p1.end_of_turn(self.log_enabled)
+            e2 = self.p2.end_of_turn(self.log_enabled)
+            if self.log_enabled:
+                for ev in e1 + e2:
+                    self.logf(ev)
+
+        # The loop ends once someone has fainted (p1 is reported if both did)
+        winner, loser = (self.p2, self.p1) if not self.p1.alive else (self.p1, self.p2)
+        self.logf(f"{loser.name} fainted!")
         self.logf(f"\n🏆 {winner.name} wins the battle! 🏆")
         # Summary
         self.logf("\nBattle Summary:")
@@ -295,65 +396,66 @@ class Battle:
         # easy: random with bias to damaging moves
         # medium: mix of status/damage using heuristics
         # hard: strategic: status if opponent high HP, finish if low HP, consider self HP
-
-        # Quick helpers
-        def has_healing(p):
-            # This demo doesn't have healing moves, but put placeholder
-            return False
-
-        # Evaluate moves
-        if difficulty == 'easy':
-            # 70% choose damaging move randomly, 30% pick random
-            damaging = [m for m in user.moves if (len(m) > 1 and m[1] > 0)]
-            status_moves = [m for m in user.moves if len(m) > 2 and m[2] in (STATUS_POISON, STATUS_PARALYSIS, STATUS_SLEEP)]
-            if damaging and random.random() < 0.7:
-                choice = random.choice(damaging)
-            else:
-                choice = random.choice(user.moves)
-            self.logf(f"🤖 AI Analysis: (easy) choosing move")
-            return choice
-
-        if difficulty == 'medium':
-            # Use some heuristics
-            damaging = sorted([m for m in user.moves if (len(m) > 1 and m[1] > 0)], key=lambda x: x[1], reverse=True)
-            status_moves = [m for m in user.moves if len(m) > 2 and m[2] in (STATUS_POISON, STATUS_PARALYSIS, STATUS_SLEEP)]
-            if opponent.hp / opponent.max_hp > 0.7 and status_moves:
-                self.logf("🤖 AI Analysis: Opponent high HP, using status move")
-                return random.choice(status_moves)
-            if opponent.hp / opponent.max_hp < 0.25 and damaging:
-                self.logf("🤖 AI Analysis: Opponent low HP, going for highest damage")
-                return damaging[0]
-            # otherwise pick medium-high damaging move
-            self.logf("🤖 AI Analysis: Balanced choice")
-            return damaging[0] if damaging else random.choice(user.moves)
-
-        # hard
-        if difficulty == 'hard':
-            damaging = sorted([m for m in user.moves if (len(m) > 1 and m[1] > 0)], key=lambda x: x[1], reverse=True)
-            status_moves = [m for m in user.moves if len(m) > 2 and m[2] in (STATUS_POISON, STATUS_PARALYSIS, STATUS_SLEEP)]
-            # If opponent high HP and we have status, use it
-            if opponent.hp / opponent.max_hp > 0.6 and status_moves:
-                self.logf("🤖 AI Analysis: Enemy has higher HP, using status move for advantage")
-                return random.choice(status_moves)
-            # If opponent paralyzed/sleeping, hit with damage
-            if STATUS_PARALYSIS in opponent.statuses or STATUS_SLEEP in opponent.statuses:
-                self.logf("🤖 AI Analysis: Enemy impaired, time for damage")
-                return damaging[0] if damaging else random.choice(user.moves)
-            # If opponent low HP, finish with strongest
-            if opponent.hp / opponent.max_hp < 0.25 and damaging:
-                self.logf("🤖 AI Analysis: Low HP enemy, finish with strongest move")
-                return damaging[0]
-            # else pick effective damage
-            self.logf("🤖 AI Analysis: Hard mode, selecting most effective move")
-            # pick damaging move with highest expected damage estimate
-            best = None
-            best_est = -1
-            for mv in damaging:
-                est, _ = calculate_damage(user, opponent, mv[1])
-                if est > best_est:
-                    best_est = est
-                    best = mv
-            return best if best else random.choice(user.moves)
+        strategy = self._ai_strategy(difficulty)
+        return strategy(user, opponent) if strategy else None
+
+    def _ai_strategy(self, difficulty: str):
+        # Bound method for a difficulty (None if unknown); start_battle looks it up once per battle
+        return {'easy': self._ai_easy, 'medium': self._ai_medium, 'hard': self._ai_hard}.get(difficulty)
+
+    def _ai_easy(self, user: Pokemon, opponent: Pokemon):
+        # 70% choose damaging move randomly, 30% pick random
+        damaging = user.damaging_idx
+        if damaging and self._rand() < 0.7:
+            choice = user.moves[self.rng.choice(damaging)]
+        else:
+            choice = self.rng.choice(user.moves)
+        self.logf(f"🤖 AI Analysis: (easy) choosing move")
+        return choice
+
+    def _ai_medium(self, user: Pokemon, opponent: Pokemon):
+        # Use some heuristics
+        damaging = user.damaging_desc
+        status_moves = user.status_moves
+        # hp * 20 against max_hp * 14 / * 5: the 0.7 / 0.25 HP-ratio thresholds as integer compares
+        hp20 = opponent.hp * 20
+        if hp20 > opponent.max_hp * 14 and status_moves:
+            self.logf("🤖 AI Analysis: Opponent high HP, using status move")
+            return self.rng.choice(status_moves)
+        if hp20 < opponent.max_hp * 5 and damaging:
+            self.logf("🤖 AI Analysis: Opponent low HP, going for highest damage")
+            return damaging[0]
+        # otherwise pick medium-high damaging move
+        self.logf("🤖 AI Analysis: Balanced choice")
+        return damaging[0] if damaging else self.rng.choice(user.moves)
+
+    def _ai_hard(self, user: Pokemon, opponent: Pokemon):
+        damaging = user.damaging_desc
+        status_moves = user.status_moves
+        hp20 = opponent.hp * 20  # see _ai_medium; * 12 is the 0.6 threshold
+        # If opponent high HP and we have status, use it
+        if hp20 > opponent.max_hp * 12 and status_moves:
+            self.logf("🤖 AI Analysis: Enemy has higher HP, using status move for advantage")
+            return self.rng.choice(status_moves)
+        # If opponent paralyzed/sleeping, hit with damage
+        if opponent.has_status(STATUS_PARALYSIS) or opponent.has_status(STATUS_SLEEP):
+            self.logf("🤖 AI Analysis: Enemy impaired, time for damage")
+            return damaging[0] if damaging else self.rng.choice(user.moves)
+        # If opponent low HP, finish with strongest
+        if hp20 < opponent.max_hp * 5 and damaging:
+            self.logf("🤖 AI Analysis: Low HP enemy, finish with strongest move")
+            return damaging[0]
+        # else pick effective damage
+        self.logf("🤖 AI Analysis: Hard mode, selecting most effective move")
+        # pick damaging move with highest expected damage estimate
+        best = None
+        best_est = -1
+        for mv in damaging:
+            est, _ = calculate_damage(user, opponent, mv[1], self._rand())
+            if est > best_est:
+                best_est = est
+                best = mv
+        return best if best else self.rng.choice(user.moves)
 
 # -------------------- Tournament --------------------
 class Tournament:
@@ -371,9 +473,16 @@ class Tournament:
             'status_effects': 0,
         }
         self.history: List[str] = []
+        self._battle: Optional[Battle] = None
 
     def run_match(self, a: Pokemon, b: Pokemon):
-        battle = Battle(a, b, verbose=self.verbose)
+        # One Battle is reused for every match; reset() fights the bracket entries
+        # themselves, so the winner keeps its remaining HP and statuses
+        battle = self._battle
+        if battle is None:
+            battle = self._battle = Battle(a, b, verbose=self.verbose, copy=False)
+        else:
+            battle.reset(a, b)
         winner_name, bstats = battle.start_battle()
         # update tournament stats
         self.stats['total_battles'] += 1
@@ -389,6 +498,7 @@ class Tournament:
         print(f"Participants: {len(self.bracket)} Pokémon\n")
         round_num = 1
         participants = self.bracket
+        runner_up = None
         while len(participants) > 1:
             print(f"=== ROUND {round_num} ===")
             next_round = []
@@ -397,6 +507,7 @@ class Tournament:
                 b = participants[i+1]
                 print(f"Match: {a.name} vs {b.name}")
                 winner = self.run_match(a, b)
+                runner_up = b if winner is a else a  # ends up as the loser of the final
                 print(f"{winner.name} advances to next round!\n")
                 # Winner proceeds with its current HP and statuses preserved
                 next_round.append(winner)
@@ -413,24 +524,116 @@ class Tournament:
         print("Final Standings:")
         # Simple standings: champion, runner-up, others tied
         print(f"1st: {champion.name}")
-        # runner-up can be inferred from history last match
-        if self.history:
-            last = self.history[-1]
-            # parse last => "X vs Y -> Winner: Z"
-            parts = last.split('->')
-            if len(parts) >= 2:
-                winner_part = parts[1].strip()
-                runner_up = None
-                # determine who lost in final by name
-                if winner_part.startswith(champion.name):
-                    # unfortunate—this case shouldn't happen normally
-                    runner_up = 'Unknown'
-                else:
-                    runner_up = winner_part.replace('Winner:','').strip()
-                print(f"2nd: {runner_up}")
+        if runner_up is not None:
+            print(f"2nd: {runner_up.name}")
         print("(Other participants eliminated in earlier rounds are tied for 3rd...)")
         return champion.name
 
+# -------------------- Headless bracket simulation --------------------
+def simulate_bracket(participants: List[Pokemon], seed: Optional[int] = None):
+    """Run a whole single-elimination bracket silently and return (champion_name, stats).
+
+    Intended for Monte-Carlo style analysis where thousands of brackets are run.
+    Battle state lives in flat per-participant lists (hp, attack, status mask, ...)
+    instead of Pokemon/Battle objects, and every match of a round advances one turn
+    per sweep. Mechanics and move choice follow Battle.auto_choose_move.
+    Winners carry their HP and statuses into the next round.
+    """
+    n = len(participants)
+    if (n & (n - 1)) != 0 or n == 0:
+        raise ValueError("Number of participants must be a power of two (4,8,16,...)")
+    rng = random.Random(seed)
+    rand = rng.random
+
+    names = [p.name for p in participants]
+    hp = [p.hp for p in participants]
+    max_hp = [p.max_hp for p in participants]
+    atk = [p.attack for p in participants]
+    dfn = [max(1, p.defense) for p in participants]
+    spd = [p.speed for p in participants]
+    poison_dmg = [math.ceil(m * POISON_PERCENT) for m in max_hp]
+    powers = [p.move_power for p in participants]
+    effects = [p.move_effect for p in participants]
+    # Same layout as Pokemon: a status bit mask each, and three duration slots each
+    status_mask = [p.status_mask for p in participants]
+    status_dur = [d for p in participants for d in p.status_dur]
+
+    stats = {
+        'total_battles': 0,
+        'total_turns': 0,
+        'critical_hits': 0,
+        'status_effects': 0,
+    }
+
+    def afflict(o, bit):
+        status_mask[o] |= bit
+        if bit == POISON_BIT:
+            status_dur[3 * o + POISON_SLOT] = POISON_DURATION
+        elif bit == PARALYSIS_BIT:
+            status_dur[3 * o + PARALYSIS_SLOT] = PARALYSIS_DURATION
+        else:
+            status_dur[3 * o + SLEEP_SLOT] = SLEEP_MIN + int(rand() * SLEEP_SPAN)
+        stats['status_effects'] += 1
+
+    def act(u, o, pick):
+        m = status_mask[u]
+        if m & SLEEP_BIT or (m & PARALYSIS_BIT and rand() < 0.5):
+            return
+        row = 2 * status_mask[o]
+        k = pick[row] if hp[o] * 10 > max_hp[o] * 7 else pick[row + 1]
+        power = powers[u][k]
+        bit = effects[u][k]
+        if power > 0:
+            dmg, was_crit = _damage_kernel(atk[u], power, dfn[o], rand())
+            if was_crit:
+                stats['critical_hits'] += 1
+            hp[o] -= dmg
+            if hp[o] < 0:
+                hp[o] = 0
+        if bit and not status_mask[o] & bit and hp[o] > 0:
+            afflict(o, bit)
+
+    alive_ids = list(range(n))
+    while len(alive_ids) > 1:
+        matches = [(alive_ids[i], alive_ids[i + 1]) for i in range(0, len(alive_ids), 2)]
+        stats['total_battles'] += len(matches)
+        # Speed order and move preferences are fixed for the whole match
+        order = []
+        for a, b in matches:
+            first, second = (a, b) if spd[a] >= spd[b] else (b, a)
+            order.append((first, second,
+                          _rank_picks(atk[first], powers[first], effects[first], dfn[second]),
+                          _rank_picks(atk[second], powers[second], effects[second], dfn[first])))
+        active = [mi for mi, (a, b) in enumerate(matches) if hp[a] > 0 and hp[b] > 0]
+        while active:
+            stats['total_turns'] += len(active)
+            for mi in active:
+                first, second, pick_first, pick_second = order[mi]
+                act(first, second, pick_first)
+                if hp[second] > 0:
+                    act(second, first, pick_second)
+            # End-of-turn effects for every fighter of every running match in one pass:
+            # poison damage, then each active status ticks down and clears at zero
+            for mi in active:
+                for i in matches[mi]:
+                    m = status_mask[i]
+                    if not m:
+                        continue
+                    if m & POISON_BIT:
+                        hp[i] = max(0, hp[i] - poison_dmg[i])
+                    base = 3 * i
+                    for slot in range(3):
+                        bit = 1 << slot
+                        if m & bit:
+                            status_dur[base + slot] -= 1
+                            if status_dur[base + slot] <= 0:
+                                m &= ~bit
+                    status_mask[i] = m
+            active = [mi for mi in active if hp[matches[mi][0]] > 0 and hp[matches[mi][1]] > 0]
+        alive_ids = [a if hp[a] > 0 else b for a, b in matches]
+
+    return names[alive_ids[0]], stats
+
 # -------------------- Example Usage --------------------
 if __name__ == '__main__':
     # Example 1: AI Battle with Status Effects
@@ -0,0 +1,32 @@
+import random
+import unittest
+
+from ps2_level3 import Battle, Pokemon, simulate_bracket
+
+
+def _status_pair():
+    # Both sides rate their status move above a weak Tackle; once each foe has
+    # the other's status, only damage can end the battle
+    a = Pokemon("A", 100, 20, 100, 50, [("Thunder Wave", 0, "paralysis"), ("Tackle", 40)])
+    b = Pokemon("B", 100, 20, 100, 40, [("Sleep Powder", 0, "sleep"), ("Tackle", 40)])
+    return a, b
+
+
+class AutoChooseMoveTest(unittest.TestCase):
+    def test_status_users_switch_to_damage(self):
+        for seed in range(20):
+            a, b = _status_pair()
+            battle = Battle(a, b, verbose=False, rng=random.Random(seed))
+            winner, stats = battle.start_battle()
+            self.assertIn(winner, ("A", "B"))
+            self.assertLess(stats['turns'], 1000)
+
+    def test_simulate_bracket_finishes(self):
+        for seed in range(20):
+            champion, stats = simulate_bracket(list(_status_pair()), seed=seed)
+            self.assertIn(champion, ("A", "B"))
+            self.assertLess(stats['total_turns'], 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,7 +23,8 @@ import json
 import os
 import math
 import signal
-from collections import deque
+from array import array
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 
 # -------------------- Configuration --------------------
@@ -37,8 +38,11 @@ PIPE_GAP_BASE = 6        # base gap size in rows
 PIPE_SPACING_BASE = 25   # base horizontal spacing (columns)
 MIN_SCREEN_WIDTH = 40
 MIN_SCREEN_HEIGHT = 20
+PIPE_GONE_X = -1.5       # a pipe at or left of this column has scrolled off
 
 SCORE_FILE = 'flappy_cli_scores.json'
+# set FLAPPY_DEBUG_JSON=1 to write the scores file indented for reading
+DEBUG_JSON = bool(os.environ.get('FLAPPY_DEBUG_JSON'))
 DEFAULT_PLAYER = 'PLAYER'
 
 # Visuals
@@ -46,26 +50,48 @@ BIRD_CHAR = '>'
 PIPE_CHAR = '█'
 GROUND_CHAR = '_'
 BG_CHAR = ' '
+PIPE_CHAR_ASCII = '#'    # used when the terminal encoding has no block character
 TITLE = 'FLAPPY BIRD CLI'
 
 # -------------------- Helper persistence --------------------
 
+# In-memory copy of SCORE_FILE; read from disk once, then kept in step by save_scores
+_SCORES_CACHE = None
+
+
+def _default_scores():
+    return {'leaderboard': [], 'stats': {'games_played': 0, 'total_score': 0, 'best_streak': 0}}
+
+
 def load_scores():
+    global _SCORES_CACHE
+    if _SCORES_CACHE is not None:
+        return _SCORES_CACHE
     if not os.path.exists(SCORE_FILE):
-        return {'leaderboard': [], 'stats': {'games_played': 0, 'total_score': 0, 'best_streak': 0}}
+        _SCORES_CACHE = _default_scores()
+        return _SCORES_CACHE
     try:
         with open(SCORE_FILE, 'r') as f:
-            return json.load(f)
+            _SCORES_CACHE = json.load(f)
     except Exception:
-        return {'leaderboard': [], 'stats': {'games_played': 0, 'total_score': 0, 'best_streak': 0}}
+        _SCORES_CACHE = _default_scores()
+    return _SCORES_CACHE
 
 
 def save_scores(data):
-    with open(SCORE_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    global _SCORES_CACHE
+    _SCORES_CACHE = data
+    # write to a temp file and swap it in so a crash never leaves a truncated file
+    tmp = SCORE_FILE + '.tmp'
+    with open(tmp, 'w') as f:
+        if DEBUG_JSON:
+            json.dump(data, f, indent=2)
+        else:
+            json.dump(data, f, separators=(',', ':'))
+    os.replace(tmp, SCORE_FILE)
 
 
-def register_score(player, score):
+def register_score(player, score, streak=None):
     data = load_scores()
     lb = data.setdefault('leaderboard', [])
     lb.append({'player': player, 'score': score, 'date': datetime.utcnow().isoformat()})
@@ -75,25 +101,62 @@ def register_score(player, score):
     stats = data.setdefault('stats', {'games_played': 0, 'total_score': 0, 'best_streak': 0})
     stats['games_played'] = stats.get('games_played', 0) + 1
     stats['total_score'] = stats.get('total_score', 0) + score
-    # best_streak handled at caller if needed
+    if streak is not None:
+        stats['best_streak'] = max(stats.get('best_streak', 0), streak)
     save_scores(data)
 
-# -------------------- Game model classes --------------------
+# -------------------- Physics --------------------
+# Per-frame numeric steps as plain functions over scalars and lists, kept apart
+# from GameState so they can be tested or compiled on their own. GameState
+# still loads and stores its fields around each call, so this is structure,
+# not a speedup by itself.
 
-class Pipe:
-    def __init__(self, x, gap_y, gap_size):
-        self.x = x  # column (float for smooth movement)
-        self.gap_y = gap_y  # top row of gap
-        self.gap_size = gap_size
+def step_bird(bird_row, vel, wind, dt):
+    # apply gravity
+    vel += GRAVITY * dt
+    # apply terminal velocity
+    if vel > TERMINAL_VELOCITY:
+        vel = TERMINAL_VELOCITY
+    # wind applies as small vertical force
+    vel += wind * dt
+    # update bird position
+    return bird_row + vel * dt, vel
 
-    def collides(self, bird_row, bird_col):
-        # bird is considered at a single cell (bird_row, bird_col)
-        bx = int(round(self.x))
-        if bx != bird_col:
-            return False
-        if bird_row < self.gap_y or bird_row >= self.gap_y + self.gap_size:
-            return True
-        return False
+
+def step_wind(wind, roll, dt):
+    # wind: small random drift (roll in [0, 1)) that changes slowly
+    wind += (roll - 0.5) * dt * 0.2
+    return max(-1.5, min(1.5, wind))
+
+
+def difficulty_for(score):
+    # (speed_multiplier, pipe_speed, pipe_gap, pipe_spacing) at a given score;
+    # speed rises and gap/spacing shrink slowly as the score grows
+    return (1.0 + score / 100.0,
+            PIPE_SPEED_BASE * (1.0 + score / 60.0),
+            max(3, int(PIPE_GAP_BASE - score // 10)),
+            max(12, int(PIPE_SPACING_BASE - score // 6)))
+
+
+# difficulty_for() precomputed for the scores real games reach
+_DIFFICULTY = tuple(difficulty_for(s) for s in range(256))
+
+
+def shift_pipes(pipe_x, head, tail, speed):
+    # move the live pipes (pipe_x[head:tail], ascending) left in place; returns
+    # how many of them have scrolled off screen
+    for i in range(head, tail):
+        pipe_x[i] -= speed
+    return bisect_right(pipe_x, PIPE_GONE_X, head, tail) - head
+
+# -------------------- Game model classes --------------------
+
+def encode_cell(ch, encoding, fallback='?'):
+    # one screen cell as the bytes curses will write for it
+    try:
+        return ch.encode(encoding)
+    except (UnicodeEncodeError, LookupError):
+        return fallback.encode('ascii')
 
 
 class GameState:
@@ -109,7 +172,22 @@ class GameState:
         self.bird_row = self.height // 2
         self.bird_col = int(self.width * 0.2)
         self.vel = 0.0
-        self.pipes = deque()
+        # pipes as parallel fixed-capacity typed buffers, oldest (leftmost)
+        # first; live pipes occupy [_pipe_head, _pipe_tail). Capacity is twice
+        # what fits on screen at the tightest spacing (12 - 5 columns) and
+        # doubles if that is ever exceeded.
+        cap = 2 * ((self.width + 12) // 7 + 1)
+        self.pipe_x = array('d', [0.0]) * cap  # column (float for smooth movement)
+        self.pipe_gap_y = array('i', [0]) * cap  # top row of gap
+        self.pipe_gap_size = array('i', [0]) * cap
+        self._pipe_head = 0
+        self._pipe_tail = 0
+        # rounded screen column of each live pipe, refreshed once per frame by
+        # step_pipes for render, and the reverse map column -> pipe index (-1
+        # where there is none) used by check_collision
+        self._pipe_cols = []
+        self._col_map_key = None  # (head, cols) the column map was built for
+        self._col_to_pipe = [-1] * (self.width + 16)
         self.score = 0
         self.distance_traveled = 0.0
         self.alive = True
@@ -119,36 +197,42 @@ class GameState:
         self.pipe_speed = PIPE_SPEED_BASE
         self.pipe_gap = PIPE_GAP_BASE
         self.pipe_spacing = PIPE_SPACING_BASE
+        self._difficulty_score = 0  # score the parameters above were set for
         self.last_pipe_x = self.width
         self.next_pipe_in = self.pipe_spacing
         self.wind = 0.0
         # procedural RNG seed
         self.rng = random.Random()
+        # every draw in the game goes through this one bound method
+        self._rand = self.rng.random
         # stats
         self.streak = 0
+        # Cells pre-encoded for the terminal, so addstr gets bytes it can write as-is
+        enc = getattr(self.scr, 'encoding', None) or 'utf-8'
+        self._bg_cell = encode_cell(BG_CHAR, enc)
+        self._bird_cell = encode_cell(BIRD_CHAR, enc)
+        self._pipe_cell = encode_cell(PIPE_CHAR, enc, PIPE_CHAR_ASCII)
+        # Frame buffers for differential rendering, one list of cells per sky row
+        # (the ground row never changes). render() fills _back, sends only what
+        # differs from _front (what is on screen now) and swaps the two.
+        self._blank_row = [self._bg_cell] * self.width
+        self._back = [self._blank_row[:] for _ in range(self.height - 1)]
+        self._front = None  # None forces a full repaint
+        self._screen_size = None
+        self._hud_key = None  # (score, speed in hundredths) the HUD shows now
 
     def tick_difficulty(self, dt):
-        # increase difficulty slowly based on score/distance
-        # we will slightly increase speed and decrease gap
-        factor = 1.0 + min(self.score / 40.0, 2.0)
-        self.speed_multiplier = 1.0 + (self.score / 100.0)
-        self.pipe_speed = PIPE_SPEED_BASE * (1.0 + self.score / 60.0)
-        self.pipe_gap = max(3, int(PIPE_GAP_BASE - self.score // 10))
-        self.pipe_spacing = max(12, int(PIPE_SPACING_BASE - self.score // 6))
-        # wind: small random drift that changes slowly
-        self.wind += (self.rng.random() - 0.5) * dt * 0.2
-        self.wind = max(-1.5, min(1.5, self.wind))
+        # difficulty only depends on the score, so look it up when that changes
+        score = self.score
+        if score != self._difficulty_score:
+            self._difficulty_score = score
+            (self.speed_multiplier, self.pipe_speed,
+             self.pipe_gap, self.pipe_spacing) = (
+                _DIFFICULTY[score] if score < len(_DIFFICULTY) else difficulty_for(score))
+        self.wind = step_wind(self.wind, self._rand(), dt)
 
     def update_physics(self, dt):
-        # apply gravity
-        self.vel += GRAVITY * dt
-        # apply terminal velocity
-        if self.vel > TERMINAL_VELOCITY:
-            self.vel = TERMINAL_VELOCITY
-        # wind applies as small vertical force
-        self.vel += self.wind * dt
-        # update bird position
-        self.bird_row += self.vel * dt
+        self.bird_row, self.vel = step_bird(self.bird_row, self.vel, self.wind, dt)
         # clamp inside screen (ground check handled elsewhere)
 
     def flap(self):
@@ -158,31 +242,58 @@ class GameState:
         # choose gap_y based on previous to keep fairness
         min_gap_top = 2
         max_gap_top = self.height - self.pipe_gap - 3
-        if len(self.pipes) == 0:
+        if self._pipe_head == self._pipe_tail:
             gap_y = self.height // 3
         else:
-            last = self.pipes[-1]
             # bias toward previous gap to avoid impossible jumps
-            delta = int((random.random() - 0.5) * 8)
-            gap_y = max(min_gap_top, min(max_gap_top, last.gap_y + delta))
-        x = float(self.width + 10)
-        p = Pipe(x=x, gap_y=gap_y, gap_size=self.pipe_gap)
-        self.pipes.append(p)
+            delta = int((self._rand() - 0.5) * 8)
+            last_gap_y = self.pipe_gap_y[self._pipe_tail - 1]
+            gap_y = max(min_gap_top, min(max_gap_top, last_gap_y + delta))
+        if self._pipe_tail == len(self.pipe_x):
+            self._make_pipe_room()
+        tail = self._pipe_tail
+        self.pipe_x[tail] = float(self.width + 10)
+        self.pipe_gap_y[tail] = gap_y
+        self.pipe_gap_size[tail] = self.pipe_gap
+        self._pipe_tail = tail + 1
+
+    def _make_pipe_room(self):
+        # buffers are full: slide the live pipes down over the passed slots,
+        # or grow the buffers when there are none to reclaim
+        head, tail = self._pipe_head, self._pipe_tail
+        if head:
+            n = tail - head
+            for buf in (self.pipe_x, self.pipe_gap_y, self.pipe_gap_size):
+                buf[:n] = buf[head:tail]
+            self._pipe_head, self._pipe_tail = 0, n
+            self._col_map_key = None  # indices moved, force a map rebuild
+        else:
+            for buf in (self.pipe_x, self.pipe_gap_y, self.pipe_gap_size):
+                buf *= 2
 
     def step_pipes(self, dt):
         speed = self.pipe_speed * dt
-        to_remove = []
-        for p in list(self.pipes):
-            p.x -= speed
-            if int(round(p.x)) + 1 < 0:
-                self.pipes.popleft()
-                # increase score when pipe passes bird
-                self.score += 1
+        passed = shift_pipes(self.pipe_x, self._pipe_head, self._pipe_tail, speed)
+        if passed:
+            self._pipe_head += passed
+            # increase score when pipe passes bird
+            self.score += passed
         # manage distance until next pipe
         self.next_pipe_in -= speed
         if self.next_pipe_in <= 0:
             self.generate_pipe()
-            self.next_pipe_in = self.pipe_spacing + random.randint(-5, 5)
+            self.next_pipe_in = self.pipe_spacing + int(self._rand() * 11) - 5
+        head = self._pipe_head
+        cols = self._pipe_cols = [int(round(x)) for x in self.pipe_x[head:self._pipe_tail]]
+        # rebuild the column map only when some pipe moved onto a new column or
+        # the live range shifted (the map holds absolute pipe indices)
+        key = (head, cols)
+        if key != self._col_map_key:
+            self._col_map_key = key
+            col_map = self._col_to_pipe = [-1] * (self.width + 16)
+            for i, c in enumerate(cols, head):
+                if 0 <= c < len(col_map):
+                    col_map[c] = i
 
     def check_collision(self):
         bird_r = int(round(self.bird_row))
@@ -190,11 +301,12 @@ class GameState:
         # ground or ceiling
         if bird_r < 0 or bird_r >= self.height - 1:
             return True
-        # pipes
-        for p in self.pipes:
-            if p.collides(bird_r, bird_c):
-                return True
-        return False
+        # pipes: bird is considered at a single cell (bird_r, bird_c)
+        i = self._col_to_pipe[bird_c]
+        if i < 0:
+            return False
+        gap_y = self.pipe_gap_y[i]
+        return not gap_y <= bird_r < gap_y + self.pipe_gap_size[i]
 
 # -------------------- Rendering --------------------
 
@@ -205,6 +317,11 @@ def draw_border(scr, w, h):
 
 
 def draw_hud(scr, state: GameState):
+    # the HUD only changes with the score and speed; skip it otherwise
+    key = (state.score, round(state.speed_multiplier * 100))
+    if key == state._hud_key:
+        return
+    state._hud_key = key
     # top line: title and score
     scr.addstr(0, 2, f" {TITLE} - Score: {state.score} ")
     # right side high info
@@ -213,62 +330,103 @@ def draw_hud(scr, state: GameState):
 
 
 def render(scr, state: GameState):
-    scr.erase()
     h, w = scr.getmaxyx()
     field_h = state.height
     field_w = state.width
+    sky_h = field_h - 1  # rows above the ground
 
-    # draw border
-    draw_border(scr, field_w, field_h)
+    # Full repaint on the first frame and after a terminal resize; afterwards
+    # the screen is only touched where the play field actually changed
+    if state._front is None or state._screen_size != (h, w):
+        scr.erase()
+        draw_border(scr, field_w, field_h)
+        # draw controls hint bottom
+        hint = 'Press SPACE to flap | P to pause | Q to quit'
+        try:
+            scr.addstr(h - 2, 2, hint)
+        except curses.error:
+            pass
+        # draw ground line; it is static, so only here
+        try:
+            scr.hline(field_h, 1, ord(GROUND_CHAR), field_w)
+        except curses.error:
+            pass
+        state._front = [[None] * field_w for _ in range(sky_h)]
+        state._screen_size = (h, w)
+        state._hud_key = None
 
     # draw HUD
     draw_hud(scr, state)
 
-    # draw pipes
-    for p in state.pipes:
-        px = int(round(p.x)) + 1  # +1 because of border
-        if px < 1 or px > field_w:
-            continue
-        # top block
-        for r in range(1, p.gap_y + 1):
-            try:
-                scr.addstr(r, px, PIPE_CHAR)
-            except curses.error:
-                pass
-        # bottom block
-        for r in range(p.gap_y + p.gap_size + 1, field_h):
-            try:
-                scr.addstr(r, px, PIPE_CHAR)
-            except curses.error:
-                pass
+    # compose the play field into the back buffer (row r is screen row r + 1)
+    back = state._back
+
+    # draw pipes: every sky row starts as a copy of one row with all pipe
+    # columns solid, then each pipe's gap is cleared again
+    solid = state._blank_row[:]
+    visible = []
+    # pipe columns were already rounded by step_pipes this frame; they ascend,
+    # so the pipes on screen are the run between two binary searches
+    cols = state._pipe_cols
+    lo = bisect_left(cols, 0)
+    hi = bisect_left(cols, field_w, lo)
+    first = state._pipe_head + lo
+    last = state._pipe_head + hi
+    for px, gap_y, gap_size in zip(cols[lo:hi], state.pipe_gap_y[first:last],
+                                   state.pipe_gap_size[first:last]):
+        solid[px] = state._pipe_cell
+        visible.append((px, gap_y, min(gap_y + gap_size, sky_h)))
+    for r in range(sky_h):
+        back[r][:] = solid
+    for px, top, bottom in visible:
+        for r in range(top, bottom):
+            back[r][px] = state._bg_cell
 
     # draw bird
-    bird_r = int(round(state.bird_row)) + 1
-    bird_c = state.bird_col + 1
-    try:
-        scr.addstr(bird_r, bird_c, BIRD_CHAR)
-    except curses.error:
-        pass
-
-    # draw ground line
-    for c in range(1, field_w + 1):
+    bird_r = int(round(state.bird_row))
+    if 0 <= bird_r < sky_h and 0 <= state.bird_col < field_w:
+        back[bird_r][state.bird_col] = state._bird_cell
+
+    # emit the changed span of each row that differs from what is on screen
+    front = state._front
+    for r in range(sky_h):
+        row = back[r]
+        old = front[r]
+        if row == old:
+            continue
+        lo = 0
+        while row[lo] == old[lo]:
+            lo += 1
+        hi = field_w
+        while row[hi - 1] == old[hi - 1]:
+            hi -= 1
         try:
-            scr.addstr(field_h, c, GROUND_CHAR)
+            scr.addstr(r + 1, lo + 1, b''.join(row[lo:hi]))
         except curses.error:
             pass
+    state._front, state._back = back, front
 
-    # draw controls hint bottom
-    h, w = scr.getmaxyx()
-    hint = 'Press SPACE to flap | P to pause | Q to quit'
-    try:
-        scr.addstr(h - 2, 2, hint)
-    except curses.error:
-        pass
-
-    scr.refresh()
+    scr.noutrefresh()
+    curses.doupdate()
 
 # -------------------- Menu and UI --------------------
 
+# input mode the screen is currently in (None until first set)
+_SCREEN_MODE = None
+
+
+def _set_mode(scr, interactive):
+    # interactive: in-game, getch waits at most one frame and curses may leave
+    # the cursor anywhere; otherwise getch blocks as the menus expect. Only
+    # touches the terminal when the mode actually changes.
+    global _SCREEN_MODE
+    if _SCREEN_MODE == interactive:
+        return
+    _SCREEN_MODE = interactive
+    scr.timeout(0 if interactive else -1)
+    scr.leaveok(interactive)
+
+
 def center_text(scr, y, text, attr=0):
     h, w = scr.getmaxyx()
     x = max(0, (w - len(text)) // 2)
@@ -276,8 +434,7 @@ def center_text(scr, y, text, attr=0):
 
 
 def main_menu(scr):
-    curses.curs_set(0)
-    scr.nodelay(False)
+    _set_mode(scr, False)
     scr.clear()
     h, w = scr.getmaxyx()
     while True:
@@ -291,6 +448,8 @@ def main_menu(scr):
         center_text(scr, h - 2, 'Press number to choose')
         scr.refresh()
         ch = scr.getch()
+        if _STATE['exit']:
+            return 'quit'
         if ch in (ord('1'), ord(' ')):
             return 'play'
         if ch == ord('2'):
@@ -304,7 +463,7 @@ def main_menu(scr):
 
 
 def show_leaderboard(scr):
-    scr.nodelay(False)
+    _set_mode(scr, False)
     scr.clear()
     data = load_scores()
     lb = data.get('leaderboard', [])
@@ -318,7 +477,7 @@ def show_leaderboard(scr):
 
 
 def show_stats(scr):
-    scr.nodelay(False)
+    _set_mode(scr, False)
     scr.clear()
     data = load_scores()
     stats = data.get('stats', {})
@@ -335,7 +494,7 @@ def show_stats(scr):
 
 
 def show_controls(scr):
-    scr.nodelay(False)
+    _set_mode(scr, False)
     scr.clear()
     center_text(scr, 2, 'Controls', curses.A_BOLD)
     center_text(scr, 4, 'SPACE - flap')
@@ -347,37 +506,46 @@ def show_controls(scr):
 # -------------------- Game loop --------------------
 
 def play(scr, player_name=DEFAULT_PLAYER):
-    curses.curs_set(0)
-    scr.nodelay(True)
+    # getch() doubles as the frame limiter: it blocks for what is left of the
+    # frame budget (set at the end of each frame) or until a key arrives. The
+    # cursor is hidden, so curses may leave it wherever the last write ended
+    # instead of moving it back after every frame.
+    _set_mode(scr, True)
     state = GameState(scr)
-    last_time = time.time()
+    last_time = time.perf_counter()
 
     # initial pipe
     state.generate_pipe()
     state.next_pipe_in = state.pipe_spacing
 
     while True:
-        now = time.time()
-        dt = now - last_time
-        if dt < 0:
-            dt = 0
-        # Cap dt to avoid huge jumps
-        dt = min(dt, 0.1)
-        last_time = now
-
-        # input handling
+        # input handling: read everything queued this frame so held keys
+        # don't pile up, but flap at most once per frame
+        flap = False
+        quit_game = False
         try:
             ch = scr.getch()
+            scr.timeout(0)
+            while ch != -1:
+                if ch in (ord(' '), ord('\n')):
+                    flap = True
+                elif ch in (ord('p'), ord('P')):
+                    state.paused = not state.paused
+                elif ch in (ord('q'), ord('Q')):
+                    quit_game = True
+                ch = scr.getch()
         except Exception:
-            ch = -1
-        if ch != -1:
-            if ch in (ord(' '), ord('\n')) and state.alive and not state.paused:
-                state.flap()
-            elif ch in (ord('p'), ord('P')):
-                state.paused = not state.paused
-            elif ch in (ord('q'), ord('Q')):
-                # quit to menu
-                break
+            pass
+        if quit_game or _STATE['exit']:
+            # quit to menu
+            break
+        if flap and state.alive and not state.paused:
+            state.flap()
+
+        now = time.perf_counter()
+        # Cap dt to avoid huge jumps
+        dt = min(now - last_time, 0.1)
+        last_time = now
 
         if not state.paused and state.alive:
             # update difficulty
@@ -394,15 +562,19 @@ def play(scr, player_name=DEFAULT_PLAYER):
         render(scr, state)
 
         if not state.alive:
+            _set_mode(scr, False)
             endscreen(scr, state, player_name)
             return state.score
 
         # frame limiter
-        time.sleep(max(0, FRAME_TIME - (time.time() - now)))
+        scr.timeout(max(0, int((FRAME_TIME - (time.perf_counter() - now)) * 1000)))
+
+    _set_mode(scr, False)
+    return state.score
 
 
 def endscreen(scr, state: GameState, player_name):
-    scr.nodelay(False)
+    _set_mode(scr, False)
     h, w = scr.getmaxyx()
     scr.clear()
     center_text(scr, 2, 'GAME OVER', curses.A_BOLD)
@@ -411,12 +583,7 @@ def endscreen(scr, state: GameState, player_name):
     scr.refresh()
     ch = scr.getch()
     if ch in (ord('s'), ord('S')):
-        register_score(player_name, state.score)
-        # update best streak if needed
-        data = load_scores()
-        stats = data.setdefault('stats', {})
-        stats['best_streak'] = max(stats.get('best_streak', 0), state.streak)
-        save_scores(data)
+        register_score(player_name, state.score, state.streak)
         center_text(scr, 8, 'Score saved. Press any key to return to menu')
         scr.getch()
     elif ch in (ord('r'), ord('R')):
@@ -429,7 +596,7 @@ def endscreen(scr, state: GameState, player_name):
 
 def prompt_player_name(scr):
     curses.echo()
-    scr.nodelay(False)
+    _set_mode(scr, False)
     scr.clear()
     center_text(scr, 2, 'Enter your name (max 12 chars):', curses.A_BOLD)
     h, w = scr.getmaxyx()
@@ -443,29 +610,33 @@ def prompt_player_name(scr):
 
 # -------------------- Signal handling for graceful exit --------------------
 
-EXITED = False
+# set from the signal handler, polled by the game loop and the menus
+_STATE = {'exit': False}
 
 def _signal_handler(sig, frame):
-    global EXITED
-    EXITED = True
-
-signal.signal(signal.SIGINT, _signal_handler)
-signal.signal(signal.SIGTERM, _signal_handler)
+    _STATE['exit'] = True
 
 # -------------------- Main --------------------
 
 def main(stdscr):
     # initial setup
     curses.use_default_colors()
+    curses.curs_set(0)
+    # installed once the terminal is set up, so a signal before this point
+    # still takes the default path out through curses.wrapper's cleanup
+    signal.signal(signal.SIGINT, _signal_handler)
+    signal.signal(signal.SIGTERM, _signal_handler)
     player = DEFAULT_PLAYER
     while True:
         choice = main_menu(stdscr)
         if choice == 'play':
             player = prompt_player_name(stdscr)
             score = play(stdscr, player)
+            if _STATE['exit']:
+                break
             # register score automatically for now
             register_score(player, score)
-        elif choice == 'quit' or EXITED:
+        elif choice == 'quit' or _STATE['exit']:
             break
 
 